@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any, Dict
 
 
@@ -14,11 +13,13 @@ def _resolve_local_ref(ref: str, defs: Dict[str, Any]) -> Any:
     for prefix in _LOCAL_REF_PREFIXES:
         if ref.startswith(prefix):
             key = ref[len(prefix) :]
-            return deepcopy(defs.get(key))
+            return defs.get(key)
     return None
 
 
 def _normalize_node(node: Any, defs: Dict[str, Any], stack: tuple[str, ...]) -> Any:
+    # Dicts and lists are always rebuilt and other JSON values are immutable,
+    # so the input schema is never aliased or mutated and needs no deepcopy.
     if isinstance(node, dict):
         ref = node.get("$ref")
         if isinstance(ref, str):
@@ -53,13 +54,12 @@ def _normalize_node(node: Any, defs: Dict[str, Any], stack: tuple[str, ...]) ->
 
 
 def normalize_tool_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
-    raw = deepcopy(schema)
     defs = {}
     for key in ("$defs", "definitions"):
-        value = raw.get(key)
+        value = schema.get(key)
         if isinstance(value, dict):
             defs.update(value)
-    return _normalize_node(raw, defs, ())
+    return _normalize_node(schema, defs, ())
 
 
 __all__ = ["normalize_tool_schema"]
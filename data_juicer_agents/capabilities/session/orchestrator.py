@@ -28,6 +28,16 @@ _HELP_TEXT = (
     "Control commands: help / exit / cancel."
 )
 
+_EXIT_TEXT = "Session ended."
+_CANCEL_TEXT = "No pending action. Continue with natural language requests."
+
+# Lower-cased control command -> (reply text, whether it ends the session).
+_CONTROL_COMMANDS: Dict[str, tuple[str, bool]] = {
+    **{cmd: (_EXIT_TEXT, True) for cmd in ("exit", "quit", "bye", "q", "退出")},
+    **{cmd: (_HELP_TEXT, False) for cmd in ("help", "h", "?", "帮助", "说明")},
+    **{cmd: (_CANCEL_TEXT, False) for cmd in ("cancel", "取消")},
+}
+
 @dataclass
 class SessionReply:
     text: str
@@ -505,21 +515,13 @@ class DJSessionAgent:
         self._debug(f"user_message={message!r}")
         self.state.history.append({"role": "user", "content": message})
 
-        lowered = message.lower()
-        if lowered in {"exit", "quit", "bye", "q", "退出"}:
+        control = _CONTROL_COMMANDS.get(message.lower())
+        if control is not None:
+            text, stop = control
             reply = _SessionMsgReply(
-                msg=self._build_simple_reply_msg("Session ended.", stop=True),
-                stop=True,
+                msg=self._build_simple_reply_msg(text, stop=stop),
+                stop=stop,
             )
-            self.state.history.append({"role": "assistant", "content": "Session ended."})
-            return reply
-        if lowered in {"help", "h", "?", "帮助", "说明"}:
-            reply = _SessionMsgReply(msg=self._build_simple_reply_msg(_HELP_TEXT))
-            self.state.history.append({"role": "assistant", "content": _HELP_TEXT})
-            return reply
-        if lowered in {"cancel", "取消"}:
-            text = "No pending action. Continue with natural language requests."
-            reply = _SessionMsgReply(msg=self._build_simple_reply_msg(text))
             self.state.history.append({"role": "assistant", "content": text})
             return reply
 
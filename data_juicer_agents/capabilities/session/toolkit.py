@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import List, Tuple
 
 from data_juicer_agents.core.tool import ToolContext, ToolSpec, list_tool_specs
@@ -39,8 +40,14 @@ def _session_sort_key(spec: ToolSpec) -> Tuple[int, str]:
     return priority, spec.name
 
 
+@lru_cache(maxsize=1)
+def _sorted_session_tool_specs() -> Tuple[ToolSpec, ...]:
+    # The default registry is itself cached, so the ordering never changes.
+    return tuple(sorted(list_tool_specs(), key=_session_sort_key))
+
+
 def get_session_tool_specs() -> List[ToolSpec]:
-    return sorted(list_tool_specs(), key=_session_sort_key)
+    return list(_sorted_session_tool_specs())
 
 
 def build_session_toolkit(runtime: SessionToolRuntime):
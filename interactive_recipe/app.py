@@ -27,6 +27,8 @@ import queue
 import uuid
 
 USER_ID = "INTERACTIVE_RECIPE"
+# Minimum seconds between re-renders of a streaming Copilot answer
+COPILOT_RENDER_INTERVAL = 0.05
 
 def call_service_in_thread(chat_history, q, session_id=None, user_id=None):
     try:
@@ -462,14 +464,33 @@ class Visualize:
                         frame_idx += 1
                         time.sleep(0.2)
                         
-                    full_response = ""
-                    while True:
-                        chunk = q.get()
-                        if chunk is None:
-                            break
-                        full_response += chunk
-                        response_placeholder.markdown(full_response + "▌")
-                    
+                    # Each render resends the whole answer, so drain every delta
+                    # already queued and re-render at most once per interval
+                    chunks = []
+                    pending = False
+                    last_render = 0.0
+                    done = False
+                    while not done:
+                        try:
+                            # Block indefinitely only once everything is on screen
+                            chunk = q.get(timeout=COPILOT_RENDER_INTERVAL if pending else None)
+                        except queue.Empty:
+                            chunk = ""
+                        while chunk:
+                            chunks.append(chunk)
+                            pending = True
+                            try:
+                                chunk = q.get_nowait()
+                            except queue.Empty:
+                                chunk = ""
+                        done = chunk is None
+                        now = time.monotonic()
+                        if pending and not done and now - last_render >= COPILOT_RENDER_INTERVAL:
+                            response_placeholder.markdown("".join(chunks) + "▌")
+                            pending = False
+                            last_render = now
+
+                    full_response = "".join(chunks)
                     response_placeholder.markdown(full_response)
             st.session_state.copilot_chat_history.append({"role": "assistant", "content": full_response})
             
@@ -1,6 +1,154 @@
 import os
 import json
-import requests
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+import httpx
+
+try:
+    # orjson decodes the many small per-delta frames considerably faster
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+# Service URL from environment variable, with local default; read once at import
+SERVICE_URL = os.getenv("COPILOT_SERVICE_URL", "http://localhost:8080")
+PROCESS_URL = f"{SERVICE_URL}/process"
+CLEAR_URL = f"{SERVICE_URL}/clear"
+
+# Shared client so consecutive chat turns reuse pooled keep-alive connections
+# instead of paying a fresh TCP/TLS handshake per request. No read timeout:
+# the service may pause between deltas while the agent is calling tools.
+_CLIENT = httpx.Client(
+    headers={'Content-Type': 'application/json'},
+    timeout=httpx.Timeout(None, connect=10.0),
+    # Keep-alive pooling only: a hard connection cap would make extra
+    # concurrent chats wait indefinitely for a free connection
+    limits=httpx.Limits(max_connections=None, max_keepalive_connections=8),
+)
+
+# Exact-match cache of complete answers to opening questions. Disabled by
+# default: a cached answer never reaches the service, so it is missing from
+# the server-side session memory used for follow-up turns.
+CACHE_SIZE = int(os.getenv("COPILOT_CACHE_SIZE", "0"))
+CACHE_TTL_SECONDS = float(os.getenv("COPILOT_CACHE_TTL_SECONDS", "3600"))
+
+
+class _ResponseCache:
+    """
+    Thread-safe LRU cache with per-entry expiry for streamed responses.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(message: str) -> str:
+        normalized = " ".join(message.lower().split())
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, chunks = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return chunks
+
+    def put(self, key: str, chunks: list):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, tuple(chunks))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+_RESPONSE_CACHE = _ResponseCache(CACHE_SIZE, CACHE_TTL_SECONDS)
+
+def _iter_byte_lines(chunks):
+    """
+    Splits a stream of raw byte chunks into lines without decoding them.
+
+    Args:
+        chunks (Iterable[bytes]): Raw body chunks as read from the socket.
+
+    Yields:
+        bytes: Each complete line, without its line terminator.
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        # Only the newly received bytes need scanning for a terminator
+        search_from = len(buffer)
+        buffer += chunk
+        start = 0
+        while True:
+            end = buffer.find(b'\n', search_from)
+            if end < 0:
+                break
+            line = bytes(buffer[start:end])
+            yield line[:-1] if line.endswith(b'\r') else line
+            start = search_from = end + 1
+        del buffer[:start]
+    if buffer:
+        yield bytes(buffer)
+
+def _iter_sse_data(lines):
+    """
+    Incrementally groups server-sent event lines into complete event payloads.
+
+    Args:
+        lines (Iterable[bytes]): Undecoded lines of the event stream.
+
+    Yields:
+        bytes: The ``data`` payload of each complete event, with multi-line
+            data fields joined by newlines.
+    """
+    data_lines = []
+    for line in lines:
+        if not line:
+            # A blank line terminates the current event
+            if data_lines:
+                yield b'\n'.join(data_lines)
+                data_lines = []
+            continue
+        if line.startswith(b'data:'):
+            value = line[5:]
+            data_lines.append(value[1:] if value.startswith(b' ') else value)
+        # Comments and other fields (event, id, retry) are not used
+    if data_lines:
+        yield b'\n'.join(data_lines)
+
+def _request_body(text: str, session_id: str = None, user_id: str = None):
+    """
+    Builds a request body in the Copilot service API format.
+    """
+    return {
+        "input": [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": text,
+                    },
+                ],
+            },
+        ],
+        "session_id": session_id,
+        "user_id": user_id,
+    }
 
 def call_copilot_service(copilot_chat_history: list = [], session_id: str = None, user_id: str = None):
     """
@@ -12,87 +160,84 @@ def call_copilot_service(copilot_chat_history: list = [], session_id: str = None
     Yields:
         str: Chunks of the assistant's response or an error message.
     """
-    # Get service URL from environment variable, with local default
-    service_url = os.getenv("COPILOT_SERVICE_URL", "http://localhost:8080")
-    
     try:
         # Convert chat history to the new API format
-        # Take the last user message from chat history
-        last_user_message = ""
-        for message in reversed(copilot_chat_history):
-            if message.get("role") == "user":
-                last_user_message = message.get("content", "")
-                break
-        
-        # Prepare request body in the new format
-        request_body = {
-            "input": [
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": last_user_message.strip(),
-                        },
-                    ],
-                },
-            ],
-            "session_id": session_id,
-            "user_id": user_id,
-        }
+        # Take the last user message from chat history; it is normally the
+        # tail entry, so only walk backwards when it is not
+        if copilot_chat_history and copilot_chat_history[-1].get("role") == "user":
+            message = copilot_chat_history[-1]
+        else:
+            message = next(
+                (m for m in reversed(copilot_chat_history) if m.get("role") == "user"),
+                {},
+            )
+        last_user_message = message.get("content", "")
+
+        # Only opening questions are cached; later turns depend on the
+        # conversation so far
+        cache_key = None
+        if CACHE_SIZE > 0 and len(copilot_chat_history) == 1:
+            cache_key = _ResponseCache.make_key(last_user_message)
+            cached_chunks = _RESPONSE_CACHE.get(cache_key)
+            if cached_chunks is not None:
+                yield from cached_chunks
+                return
+        received_chunks = []
+        # Status of the latest run-level event; the runtime ends every stream
+        # with a "completed" or "failed" one, even when the agent errors out
+        response_status = None
         
         # Make the HTTP request
-        response = requests.post(
-            f"{service_url}/process",
-            headers={
-                'Content-Type': 'application/json',
-                'x-session-id': session_id,
-            },
-            json=request_body,
-            stream=True
-        )
-        
-        # Check if request was successful
-        if response.status_code != 200:
-            error_msg = f"API Error: {response.status_code} - {response.text}"
-            yield error_msg
-            return
-        
-        # Process streaming response
-        buffer = ''
-        for chunk in response.iter_content(chunk_size=1024, decode_unicode=True):
-            if chunk:
-                buffer += chunk
-                lines = buffer.split('\n')
-                buffer = lines.pop() or ''
-                
-                for line in lines:
-                    if not line.strip() or not line.startswith('data:'):
-                        continue
-                    
-                    json_string = line[5:].strip()  # Remove 'data:' prefix
-                    if not json_string:
-                        continue
-                    
-                    try:
-                        data = json.loads(json_string)
-                        
-                        # Process different types of response data
-                        if (data.get("object") == "content" and 
-                            data.get("type") == "text" and 
-                            data.get("delta") == True):
-                            # Incremental text content
-                            text_chunk = data.get("text", "")
-                            if text_chunk:
-                                yield text_chunk
-                                
-                    except json.JSONDecodeError:
-                        # Skip malformed JSON
-                        continue
-
-    except requests.exceptions.RequestException as e:
+        with _CLIENT.stream(
+            "POST",
+            PROCESS_URL,
+            # httpx rejects None header values, unlike requests
+            headers={'x-session-id': session_id} if session_id else None,
+            json=_request_body(last_user_message.strip(), session_id, user_id),
+        ) as response:
+            # Check if request was successful
+            if response.status_code != 200:
+                response.read()
+                error_msg = f"API Error: {response.status_code} - {response.text}"
+                yield error_msg
+                return
+
+            # Process streaming response event by event; frames whose JSON
+            # spans several data lines are reassembled before decoding.
+            # Chunks arrive as large as each socket read (up to 64 KB) and
+            # stay as bytes: only the JSON payload is ever decoded.
+            for json_string in _iter_sse_data(_iter_byte_lines(response.iter_bytes())):
+                if not json_string.strip():
+                    continue
+
+                try:
+                    data = _json_loads(json_string)
+
+                    # Process different types of response data
+                    if data.get("object") == "response":
+                        response_status = data.get("status")
+                    elif (data.get("object") == "content" and
+                        data.get("type") == "text" and
+                        data.get("delta") == True):
+                        # Incremental text content
+                        text_chunk = data.get("text", "")
+                        if text_chunk:
+                            if cache_key is not None:
+                                received_chunks.append(text_chunk)
+                            yield text_chunk
+
+                except _JSONDecodeError:
+                    # Skip malformed JSON
+                    continue
+
+        # Only answers the service reported as completed are reused; a failed
+        # run still closes the stream normally after a partial answer
+        if cache_key is not None and received_chunks and response_status == "completed":
+            _RESPONSE_CACHE.put(cache_key, received_chunks)
+
+    except httpx.HTTPError as e:
         # Handle connection errors
-        error_msg = f"Failed to connect to Copilot service at {service_url}. Make sure it's running. Error: {str(e)}"
+        error_msg = f"Failed to connect to Copilot service at {SERVICE_URL}. Make sure it's running. Error: {str(e)}"
         yield error_msg
     except Exception as e:
         # Handle other exceptions
@@ -103,29 +248,9 @@ def clear_copilot_chat_history(session_id: str = None, user_id: str = None):
     """
     Clears the Copilot chat history.
     """
-    service_url = os.getenv("COPILOT_SERVICE_URL", "http://localhost:8080")
-    request_body = {
-        "input": [
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": "",
-                        },
-                    ],
-                },
-            ],
-        "session_id": session_id,
-        "user_id": user_id,
-    }
-    
-    response = requests.post(
-            f"{service_url}/clear",
-            headers={
-                'Content-Type': 'application/json',
-            },
-            json=request_body,
+    response = _CLIENT.post(
+            CLEAR_URL,
+            json=_request_body("", session_id, user_id),
         )
     
     if response.status_code != 200:
@@ -137,3 +262,9 @@ def clear_copilot_chat_history(session_id: str = None, user_id: str = None):
     else:
         return "error"
 
+
+def close_copilot_session():
+    """
+    Closes the pooled HTTP connections held by the Copilot client.
+    """
+    _CLIENT.close()
@@ -22,6 +22,7 @@
 import os
 import json
 import asyncio
+import tempfile
 import time
 import traceback
 from loguru import logger
@@ -78,33 +79,72 @@ class JSONSessionHistoryService(object):
         self, session_id: str, user_id: Optional[str] = None
     ) -> List[Msg]:
         session_save_path = self.session._get_save_path(session_id, user_id)
-        if not os.path.exists(session_save_path):
-            logger.warning(f"session_save_path={session_save_path} not exists")
-            return []
         try:
-            with open(
-                session_save_path,
-                "r",
-                encoding="utf-8",
-                errors="surrogatepass",
-            ) as file:
-                memory_states = json.load(file)["agent"]["memory"]
-                temp_memory = InMemoryMemory()
-                temp_memory.load_state_dict(memory_states)
-                memory = await temp_memory.get_memory()
-                return memory
+            # Read off the event loop so concurrent sessions keep streaming
+            states = await asyncio.to_thread(
+                self._read_session_states, session_save_path
+            )
+            if states is None:
+                logger.warning(f"session_save_path={session_save_path} not exists")
+                return []
+            temp_memory = InMemoryMemory()
+            temp_memory.load_state_dict(states["agent"]["memory"])
+            memory = await temp_memory.get_memory()
+            return memory
         except (json.JSONDecodeError, KeyError, TypeError) as e:
             logger.warning(
                 f"Failed to load or parse memory from {session_save_path}: {e}"
             )
             return []
 
+    @staticmethod
+    def _read_session_states(session_save_path: str) -> Optional[Dict[str, Any]]:
+        """Read the saved session states, or None if no session file."""
+        if not os.path.exists(session_save_path):
+            return None
+        with open(
+            session_save_path,
+            "r",
+            encoding="utf-8",
+            errors="surrogatepass",
+        ) as file:
+            return json.load(file)
+
+    @staticmethod
+    def _write_session_states(
+        session_save_path: str, states: Dict[str, Any]
+    ) -> None:
+        """Write session states atomically so concurrent readers never see a partial file."""
+        # Unique name in the same directory so os.replace stays atomic
+        file = tempfile.NamedTemporaryFile(
+            "w",
+            dir=os.path.dirname(session_save_path),
+            prefix=f"{os.path.basename(session_save_path)}.",
+            suffix=".tmp",
+            delete=False,
+            encoding="utf-8",
+            errors="surrogatepass",
+        )
+        try:
+            with file:
+                json.dump(states, file, ensure_ascii=False)
+            os.replace(file.name, session_save_path)
+        except BaseException:
+            # Don't leave stray temp files behind in the session directory
+            if os.path.exists(file.name):
+                os.remove(file.name)
+            raise
+
     async def delete_session(
         self, session_id: str, user_id: Optional[str] = None
     ) -> None:
         session_save_path = self.session._get_save_path(session_id, user_id)
-        if os.path.exists(session_save_path):
-            os.remove(session_save_path)
+        await asyncio.to_thread(self._remove_file, session_save_path)
+
+    @staticmethod
+    def _remove_file(file_path: str) -> None:
+        if os.path.exists(file_path):
+            os.remove(file_path)
 
     async def load_session_state(
         self,
@@ -112,15 +152,24 @@ class JSONSessionHistoryService(object):
         agent: AgentBase,
         user_id: Optional[str] = None,
     ) -> None:
-        await self.session.load_session_state(
-            session_id=session_id, agent=agent, user_id=user_id
+        # Same file layout as JSONSession, but the file is read in a worker
+        # thread; only applying the state touches the agent on the loop
+        session_save_path = self.session._get_save_path(session_id, user_id)
+        states = await asyncio.to_thread(
+            self._read_session_states, session_save_path
         )
+        if states is not None and "agent" in states:
+            agent.load_state_dict(states["agent"])
 
     async def save_session_state(
         self, session_id: str, agent: AgentBase, user_id: Optional[str] = None
     ) -> None:
-        await self.session.save_session_state(
-            session_id=session_id, agent=agent, user_id=user_id
+        # Snapshot the agent state on the loop, then serialize and write it
+        # in a worker thread
+        session_save_path = self.session._get_save_path(session_id, user_id)
+        states = {"agent": agent.state_dict()}
+        await asyncio.to_thread(
+            self._write_session_states, session_save_path, states
         )
 
     def create_memory(self, user_id: str, session_id: str):
@@ -334,24 +383,9 @@ class TTLJSONSessionHistoryService(JSONSessionHistoryService):
         """Perform one cleanup cycle: scan files and delete expired sessions."""
         async with self._cleanup_lock:
             try:
-                session_files = self._get_session_files()
-                now = time.time()
-                expired_sessions: List[str] = []
-
-                for file_path in session_files:
-                    try:
-                        # Get file modification time
-                        mtime = os.path.getmtime(file_path)
-                        # Check if expired
-                        if now - mtime > self._ttl_seconds:
-                            session_id = self._get_session_id_from_path(file_path)
-                            if session_id:
-                                expired_sessions.append(session_id)
-                    except (OSError, ValueError) as e:
-                        logger.warning(
-                            f"Failed to check file {file_path} for expiration: {e}"
-                        )
-                        continue
+                expired_sessions = await asyncio.to_thread(
+                    self._find_expired_sessions
+                )
 
                 # Delete expired sessions
                 for session_id in expired_sessions:
@@ -375,6 +409,29 @@ class TTLJSONSessionHistoryService(JSONSessionHistoryService):
             except Exception as e:
                 logger.error(f"Error during cleanup: {e}")
 
+    def _find_expired_sessions(self) -> List[str]:
+        """Scan session files and return IDs of those past their TTL."""
+        session_files = self._get_session_files()
+        now = time.time()
+        expired_sessions: List[str] = []
+
+        for file_path in session_files:
+            try:
+                # Get file modification time
+                mtime = os.path.getmtime(file_path)
+                # Check if expired
+                if now - mtime > self._ttl_seconds:
+                    session_id = self._get_session_id_from_path(file_path)
+                    if session_id:
+                        expired_sessions.append(session_id)
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    f"Failed to check file {file_path} for expiration: {e}"
+                )
+                continue
+
+        return expired_sessions
+
     def _get_session_files(self) -> List[str]:
         """Get all session JSON files from the save directory."""
         session_files = []
@@ -421,9 +478,30 @@ class FeedbackRequest(BaseModel):
     id: Optional[str] = None
 
 
-async def add_qa_tools(
-    toolkit: Toolkit,
-):
+def _create_faq_knowledge() -> SimpleKnowledge:
+    """Build the FAQ knowledge base on the existing Qdrant collection."""
+    return SimpleKnowledge(
+        embedding_store=QdrantStore(
+            # location=":memory:",
+            location=None,
+            client_kwargs={
+                "host": os.getenv(
+                    "QDRANT_HOST", "127.0.0.1"
+                ),  # Qdrant server address
+                "port": int(os.getenv("QDRANT_PORT", "6333")),  # Qdrant server port
+            },
+            collection_name="dj_faq",
+            dimensions=1024,  # The dimension of the embedding vectors
+        ),
+        embedding_model=DashScopeTextEmbedding(
+            api_key=os.environ["DASHSCOPE_API_KEY"],
+            model_name="text-embedding-v4",
+        ),
+    )
+
+
+async def _build_faq_knowledge() -> SimpleKnowledge:
+    """Ensure the FAQ RAG collection exists and return a knowledge base on it."""
     try:
         # Check and initialize RAG data if needed
         from rag_utils.create_rag_file import (
@@ -460,40 +538,14 @@ async def add_qa_tools(
                 "RAG data already initialized. Skipping initialization.",
             )
 
-        knowledge = SimpleKnowledge(
-            embedding_store=QdrantStore(
-                # location=":memory:",
-                location=None,
-                client_kwargs={
-                    "host": os.getenv(
-                        "QDRANT_HOST", "127.0.0.1"
-                    ),  # Qdrant server address
-                    "port": int(os.getenv("QDRANT_PORT", "6333")),  # Qdrant server port
-                },
-                collection_name="dj_faq",
-                dimensions=1024,  # The dimension of the embedding vectors
-            ),
-            embedding_model=DashScopeTextEmbedding(
-                api_key=os.environ["DASHSCOPE_API_KEY"],
-                model_name="text-embedding-v4",
-            ),
-        )
-        toolkit.register_tool_function(
-            knowledge.retrieve_knowledge,
-            func_description=(  # Provide a clear description for the tool
-                "Quickly retrieve answers to questions related to "
-                "the Data-juicer FAQ. The `query` parameter is crucial "
-                "for retrieval quality."
-                "You may try multiple different queries to get the best "
-                "results. Adjust the `limit` and `score_threshold` "
-                "parameters to control the number and relevance of results."
-            ),
-            # group_name="qa_mode",
-        )
+        # Store and embedding client construction is synchronous
+        return await asyncio.to_thread(_create_faq_knowledge)
     except Exception as e:
         print(traceback.format_exc())
         raise e from None
 
+
+async def _register_github_mcp(toolkit: Toolkit) -> None:
     github_token = os.getenv("GITHUB_TOKEN")
     if not github_token:
         logger.error(
@@ -501,28 +553,65 @@ async def add_qa_tools(
             "Please export GITHUB_TOKEN in your environment before "
             "proceeding.",
         )
-    else:
-        try:
-            github_client = HttpStatelessClient(
-                name="github",
-                transport="streamable_http",
-                url="https://api.githubcopilot.com/mcp/",
-                headers={"Authorization": (f"Bearer {github_token}")},
-            )
+        return
 
-            await toolkit.register_mcp_client(
-                github_client,
-                enable_funcs=[
-                    "search_repositories",
-                    "search_code",
-                    "get_file_contents",
-                ],
-                # group_name="qa_mode",
-            )
-            # toolkit.register_tool_function(execute_shell_command)
-        except Exception as e:
-            print(traceback.format_exc())
-            raise e from None
+    try:
+        github_client = HttpStatelessClient(
+            name="github",
+            transport="streamable_http",
+            url="https://api.githubcopilot.com/mcp/",
+            headers={"Authorization": (f"Bearer {github_token}")},
+        )
+
+        await toolkit.register_mcp_client(
+            github_client,
+            enable_funcs=[
+                "search_repositories",
+                "search_code",
+                "get_file_contents",
+            ],
+            # group_name="qa_mode",
+        )
+        # toolkit.register_tool_function(execute_shell_command)
+    except Exception as e:
+        print(traceback.format_exc())
+        raise e from None
+
+
+async def add_qa_tools(
+    toolkit: Toolkit,
+):
+    # RAG setup and MCP registration are independent network round trips,
+    # so run them concurrently to cut service start-up time. On the first
+    # failure the other task is cancelled so it cannot keep mutating the
+    # shared toolkit after add_qa_tools has raised.
+    knowledge_task = asyncio.create_task(_build_faq_knowledge())
+    mcp_task = asyncio.create_task(_register_github_mcp(toolkit))
+    done, pending = await asyncio.wait(
+        (knowledge_task, mcp_task), return_when=asyncio.FIRST_EXCEPTION
+    )
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    # Retrieve every exception (not just the first) so asyncio never logs
+    # "Task exception was never retrieved" when both tasks fail together
+    errors = [task.exception() for task in (knowledge_task, mcp_task) if task in done]
+    for error in errors:
+        if error is not None:
+            raise error
+    knowledge = knowledge_task.result()
+    toolkit.register_tool_function(
+        knowledge.retrieve_knowledge,
+        func_description=(  # Provide a clear description for the tool
+            "Quickly retrieve answers to questions related to "
+            "the Data-juicer FAQ. The `query` parameter is crucial "
+            "for retrieval quality."
+            "You may try multiple different queries to get the best "
+            "results. Adjust the `limit` and `score_threshold` "
+            "parameters to control the number and relevance of results."
+        ),
+        # group_name="qa_mode",
+    )
 
     # Initialize and register DJ Operator Retriever tools
     dj_retriever = DJOperatorRetriever()
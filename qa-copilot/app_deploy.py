@@ -5,7 +5,6 @@ import os
 import json
 import importlib.util
 import time
-import copy
 from typing import Optional, Tuple, Any, Callable, Awaitable
 
 from session_logger import SessionLogger, ENABLE_SESSION_LOGGING
@@ -89,6 +88,24 @@ formatter = DashScopeChatFormatter(
 )
 toolkit = Toolkit()
 
+# Model shared by all queries without per-request overrides; it keeps no
+# conversation state, so only the agent and its memory are built per query
+_default_model: Optional[DashScopeChatModel] = None
+
+
+def _get_model(request_model_params: dict) -> DashScopeChatModel:
+    """Return the shared model, or a dedicated one if the request overrides params."""
+    global _default_model
+    if request_model_params:
+        # model_params only holds immutable scalars, so a shallow copy is
+        # enough to keep per-request overrides from leaking across queries
+        _model_params = dict(model_params)
+        _model_params.update(request_model_params)
+        return DashScopeChatModel(**_model_params)
+    if _default_model is None:
+        _default_model = DashScopeChatModel(**model_params)
+    return _default_model
+
 
 # Safe Check Dynamic Import
 async def _dummy_check_user_input_safety(
@@ -270,11 +287,8 @@ async def query_func(
             user_id=user_id, session_id=session_id
         )
 
-        _model_params = copy.deepcopy(model_params)
-        _model_params.update(request_model_params)
-
         # Model Configuration
-        model = DashScopeChatModel(**_model_params)
+        model = _get_model(request_model_params)
 
         # Build agent configuration
         agent_config = {
@@ -271,8 +271,14 @@ async def check_rag_initialized(
     Check if RAG data is already initialized in Qdrant.
 
     This function will start Qdrant container if it's not running,
-    then check if the collection exists and has data.
+    then check if the collection exists and has data. The check is fully
+    blocking (docker, HTTP polling, sync Qdrant client), so it runs in a
+    worker thread to keep the event loop free.
     """
+    return await asyncio.to_thread(_check_rag_initialized_blocking, collection_name)
+
+
+def _check_rag_initialized_blocking(collection_name: str) -> bool:
     try:
         # Ensure Qdrant container is running
         if not check_container_running(QDRANT_CONTAINER_NAME):
@@ -340,7 +346,7 @@ async def initialize_rag(
         collection_name: Name of the Qdrant collection.
     """
     # Start Qdrant container automatically
-    start_qdrant_container()
+    await asyncio.to_thread(start_qdrant_container)
 
     # Use provided file or default file
     if faq_file_path is None:
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+import importlib.util
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+
+_MODULE_PATH = Path(__file__).resolve().parents[1] / "interactive_recipe" / "copilot_client.py"
+
+
+def _load_copilot_client():
+    spec = importlib.util.spec_from_file_location("copilot_client", _MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _sse_body(*events):
+    return "".join(f"data: {json.dumps(event)}\n\n" for event in events).encode("utf-8")
+
+
+def _delta(text):
+    return {"object": "content", "type": "text", "delta": True, "text": text}
+
+
+@pytest.fixture
+def copilot_client(monkeypatch):
+    module = _load_copilot_client()
+    monkeypatch.setattr(module, "CACHE_SIZE", 8)
+    monkeypatch.setattr(module, "_RESPONSE_CACHE", module._ResponseCache(8, 60))  # pylint: disable=protected-access
+    return module
+
+
+def _use_transport(monkeypatch, module, bodies):
+    requests = []
+
+    def _handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=bodies[len(requests) - 1])
+
+    monkeypatch.setattr(module, "_CLIENT", httpx.Client(transport=httpx.MockTransport(_handler)))
+    return requests
+
+
+def _split_every(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_sse_framing_reassembles_events_split_across_reads():
+    module = _load_copilot_client()
+    stream = (
+        'data: {"text": "héllo 数据"}\r\n\r\n'
+        ': keep-alive comment\r\n'
+        'data: {"a":\r\n'
+        'data: 1}\r\n'
+        '\r\n'
+        'event: done\n'
+        'data:{"b": 2}'
+    ).encode("utf-8")
+
+    for size in (1, 2, 3, 7, len(stream)):
+        chunks = _split_every(stream, size)
+        events = list(module._iter_sse_data(module._iter_byte_lines(chunks)))  # pylint: disable=protected-access
+
+        assert events == [
+            '{"text": "héllo 数据"}'.encode("utf-8"),
+            b'{"a":\n1}',
+            b'{"b": 2}',
+        ]
+        assert [json.loads(event) for event in events] == [
+            {"text": "héllo 数据"},
+            {"a": 1},
+            {"b": 2},
+        ]
+
+
+def test_copilot_cache_replays_completed_answer_without_request(copilot_client, monkeypatch):
+    completed = _sse_body(
+        {"object": "response", "status": "created"},
+        _delta("Install "),
+        _delta("with pip."),
+        {"object": "response", "status": "completed"},
+    )
+    requests = _use_transport(monkeypatch, copilot_client, [completed])
+    history = [{"role": "user", "content": "How do I install DJ?"}]
+
+    first = list(copilot_client.call_copilot_service(history, "s1", "u1"))
+    second = list(copilot_client.call_copilot_service(
+        [{"role": "user", "content": "  how do I   install dj? "}], "s2", "u1"
+    ))
+
+    assert first == ["Install ", "with pip."]
+    assert second == first
+    assert len(requests) == 1
+    assert requests[0].headers["x-session-id"] == "s1"
+
+
+def test_copilot_cache_misses_on_follow_up_turns(copilot_client, monkeypatch):
+    body = _sse_body(_delta("answer"), {"object": "response", "status": "completed"})
+    requests = _use_transport(monkeypatch, copilot_client, [body, body])
+    history = [
+        {"role": "user", "content": "What is DJ?"},
+        {"role": "assistant", "content": "A data toolkit."},
+        {"role": "user", "content": "What is DJ?"},
+    ]
+
+    assert list(copilot_client.call_copilot_service(history, "s1", "u1")) == ["answer"]
+    assert list(copilot_client.call_copilot_service(history, "s1", "u1")) == ["answer"]
+    assert len(requests) == 2
+
+
+def test_copilot_cache_skips_failed_stream(copilot_client, monkeypatch):
+    failed = _sse_body(
+        _delta("partial"),
+        {"object": "response", "status": "failed", "error": {"message": "boom"}},
+    )
+    completed = _sse_body(_delta("full answer"), {"object": "response", "status": "completed"})
+    requests = _use_transport(monkeypatch, copilot_client, [failed, completed])
+    history = [{"role": "user", "content": "How do I install DJ?"}]
+
+    assert list(copilot_client.call_copilot_service(history, "s1", "u1")) == ["partial"]
+    assert list(copilot_client.call_copilot_service(history, "s2", "u1")) == ["full answer"]
+    assert len(requests) == 2
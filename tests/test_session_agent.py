@@ -403,6 +403,21 @@ def test_session_agent_handle_as_studio_turn_async_handles_exit_without_stream()
     assert reply.msg.metadata["dj_stop"] is True
 
 
+def test_session_agent_control_commands_reply_without_react_agent():
+    agent = DJSessionAgent(use_llm_router=False)
+
+    help_reply = agent.handle_message("  HELP ")
+    cancel_reply = agent.handle_message("取消")
+    exit_reply = agent.handle_message("Quit")
+
+    assert "Control commands" in help_reply.text
+    assert help_reply.stop is False
+    assert cancel_reply.text.startswith("No pending action")
+    assert cancel_reply.stop is False
+    assert exit_reply.text == "Session ended."
+    assert exit_reply.stop is True
+
+
 def test_session_agent_forward_stream_chunk_uses_callback():
     from agentscope.message import Msg
 
@@ -8,6 +8,7 @@ from data_juicer_agents.adapters.agentscope import (
     build_agentscope_json_schema,
     build_agentscope_tool_function,
 )
+from data_juicer_agents.adapters.agentscope.schema_utils import normalize_tool_schema
 from data_juicer_agents.core.tool import ToolContext, build_default_tool_registry
 
 
@@ -34,6 +35,22 @@ def test_build_process_spec_schema_stays_shallow_for_agent_calls():
     assert params["properties"]["operators"]["items"]["required"] == ["name", "params"]
 
 
+def test_normalize_tool_schema_does_not_share_containers_with_input():
+    schema = {
+        "type": "object",
+        "properties": {"op": {"$ref": "#/$defs/Op", "description": "an op"}},
+        "$defs": {"Op": {"type": "object", "properties": {"name": {"type": "string"}}}},
+    }
+    original = json.loads(json.dumps(schema))
+
+    normalized = normalize_tool_schema(schema)
+    normalized["properties"]["op"]["properties"]["name"]["type"] = "integer"
+
+    assert schema == original
+    assert normalized["properties"]["op"]["description"] == "an op"
+    assert "$defs" not in normalized
+
+
 def test_build_agentscope_tool_function_uses_arg_preview():
     pytest.importorskip("agentscope")
     spec = build_default_tool_registry().get("execute_python_code")